@@ -1,11 +1,47 @@
 """Interface for agents."""
-from langchain.agents.agent import Agent, AgentExecutor
-from langchain.agents.load_tools import get_all_tool_names, load_tools
-from langchain.agents.loading import initialize_agent
-from langchain.agents.mrkl.base import MRKLChain, ZeroShotAgent
-from langchain.agents.react.base import ReActChain, ReActTextWorldAgent
-from langchain.agents.self_ask_with_search.base import SelfAskWithSearchChain
-from langchain.agents.tools import Tool
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from langchain.agents.agent import Agent, AgentExecutor
+    from langchain.agents.load_tools import get_all_tool_names, load_tools
+    from langchain.agents.loading import initialize_agent
+    from langchain.agents.mrkl.base import MRKLChain, ZeroShotAgent
+    from langchain.agents.react.base import ReActChain, ReActTextWorldAgent
+    from langchain.agents.self_ask_with_search.base import SelfAskWithSearchChain
+    from langchain.agents.tools import Tool
+
+# Map each exported name to the submodule that defines it, so importing
+# langchain.agents does not eagerly build every agent's pydantic models.
+_module_lookup: Dict[str, str] = {
+    "Agent": "langchain.agents.agent",
+    "AgentExecutor": "langchain.agents.agent",
+    "get_all_tool_names": "langchain.agents.load_tools",
+    "load_tools": "langchain.agents.load_tools",
+    "initialize_agent": "langchain.agents.loading",
+    "MRKLChain": "langchain.agents.mrkl.base",
+    "ZeroShotAgent": "langchain.agents.mrkl.base",
+    "ReActChain": "langchain.agents.react.base",
+    "ReActTextWorldAgent": "langchain.agents.react.base",
+    "SelfAskWithSearchChain": "langchain.agents.self_ask_with_search.base",
+    "Tool": "langchain.agents.tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the requested name lazily (PEP 562)."""
+    if name not in _module_lookup:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_module_lookup[name])
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir()."""
+    return list(__all__)
+
 
 __all__ = [
     "MRKLChain",
@@ -1,5 +1,7 @@
 """Base interface that all chains should implement."""
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Extra, Field, validator
@@ -102,6 +104,16 @@ class Chain(BaseModel, ABC):
     def _call(self, inputs: Dict[str, str]) -> Dict[str, str]:
         """Run the logic of this chain and return the output."""
 
+    async def _acall(self, inputs: Dict[str, str]) -> Dict[str, str]:
+        """Run the logic of this chain asynchronously and return the output.
+
+        Chains backed by async clients should override this; the default
+        runs the synchronous ``_call`` in an executor so the event loop
+        is not blocked.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, partial(self._call, inputs))
+
     def __call__(
         self, inputs: Union[Dict[str, Any], Any], return_only_outputs: bool = False
     ) -> Dict[str, Any]:
@@ -154,6 +166,58 @@ class Chain(BaseModel, ABC):
         else:
             return {**inputs, **outputs}
 
+    async def acall(
+        self, inputs: Union[Dict[str, Any], Any], return_only_outputs: bool = False
+    ) -> Dict[str, Any]:
+        """Run the logic of this chain asynchronously and add to output if desired.
+
+        Args:
+            inputs: Dictionary of inputs, or single input if chain expects
+                only one param.
+            return_only_outputs: boolean for whether to return only outputs in the
+                response. If True, only new keys generated by this chain will be
+                returned. If False, both input keys and new keys generated by this
+                chain will be returned. Defaults to False.
+
+        """
+        if not isinstance(inputs, dict):
+            _input_keys = set(self.input_keys)
+            if self.memory is not None:
+                # If there are multiple input keys, but some get set by memory so that
+                # only one is not set, we can still figure out which key it is.
+                _input_keys = _input_keys.difference(self.memory.memory_variables)
+            if len(_input_keys) != 1:
+                raise ValueError(
+                    f"A single string input was passed in, but this chain expects "
+                    f"multiple inputs ({_input_keys}). When a chain expects "
+                    f"multiple inputs, please call it by passing in a dictionary, "
+                    "eg `chain({'foo': 1, 'bar': 2})`"
+                )
+            inputs = {list(_input_keys)[0]: inputs}
+        if self.memory is not None:
+            external_context = self.memory.load_memory_variables(inputs)
+            inputs = dict(inputs, **external_context)
+        self._validate_inputs(inputs)
+        if self.verbose:
+            self.callback_manager.on_chain_start(
+                {"name": self.__class__.__name__}, inputs
+            )
+        try:
+            outputs = await self._acall(inputs)
+        except Exception as e:
+            if self.verbose:
+                self.callback_manager.on_chain_error(e)
+            raise e
+        if self.verbose:
+            self.callback_manager.on_chain_end(outputs)
+        self._validate_outputs(outputs)
+        if self.memory is not None:
+            self.memory.save_context(inputs, outputs)
+        if return_only_outputs:
+            return outputs
+        else:
+            return {**inputs, **outputs}
+
     def apply(self, input_list: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Call the chain on all inputs in the list."""
         return [self(inputs) for inputs in input_list]
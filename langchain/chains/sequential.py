@@ -1,20 +1,29 @@
 """Chain pipeline where the outputs of one step feed directly into next."""
 
-from typing import Dict, List
+import asyncio
+from collections import ChainMap
+from typing import Any, Dict, FrozenSet, List, Mapping, MutableMapping, Optional, Tuple
 
-from pydantic import BaseModel, Extra, root_validator
+from pydantic import BaseModel, Extra, Field, PrivateAttr, root_validator
 
 from langchain.chains.base import Chain
+from langchain.chains.llm import LLMChain
 from langchain.input import get_color_mapping
 
+_BOLD = "\033[1m"
+_RESET = "\033[0m"
+
+
+def _chain_step_summary(i: int, outputs: Dict[str, str]) -> str:
+    """Summarize one chain step without serializing the full outputs."""
+    keys = ", ".join(f"{k} ({len(v)} chars)" for k, v in outputs.items())
+    return f"{_BOLD}Chain {i}{_RESET}: {keys}"
 
-class SequentialChain(Chain, BaseModel):
-    """Chain where the outputs of one step feed directly into next."""
+
+class _BaseSequential(Chain, BaseModel):
+    """Base class holding the sub-chain list shared by sequential chains."""
 
     chains: List[Chain]
-    input_variables: List[str]
-    output_variables: List[str]  #: :meta private:
-    return_all: bool = False
 
     class Config:
         """Configuration for this pydantic object."""
@@ -22,6 +31,45 @@ class SequentialChain(Chain, BaseModel):
         extra = Extra.forbid
         arbitrary_types_allowed = True
 
+
+class SequentialChain(_BaseSequential):
+    """Chain where the outputs of one step feed directly into next."""
+
+    input_variables: List[str]
+    output_variables: List[str]  #: :meta private:
+    return_all: bool = False
+    cache: Optional[
+        MutableMapping[Tuple[int, FrozenSet[Tuple[str, str]]], Dict[str, str]]
+    ] = None
+    """Optional mapping used to memoize sub-chain outputs by exact inputs."""
+    _levels: List[List[int]] = PrivateAttr(default_factory=list)
+    _chain_input_keys: List[Tuple[str, ...]] = PrivateAttr(default_factory=list)
+    _output_key_tuple: Tuple[str, ...] = PrivateAttr(default=())
+
+    def __init__(self, **data: Any) -> None:
+        """Initialize the chain and group sub-chains into dependency levels."""
+        super().__init__(**data)
+        # Input/output keys are pydantic properties that re-compute on every
+        # access, so freeze them once here for the _call/_acall hot paths.
+        self._chain_input_keys = [tuple(chain.input_keys) for chain in self.chains]
+        self._output_key_tuple = tuple(self.output_variables)
+        # Chains in the same level have all their inputs satisfied by earlier
+        # levels, so they are independent of each other and can run concurrently.
+        known_variables = set(self.input_variables)
+        remaining = list(range(len(self.chains)))
+        levels: List[List[int]] = []
+        while remaining:
+            ready = [
+                i
+                for i in remaining
+                if set(self.chains[i].input_keys).issubset(known_variables)
+            ]
+            levels.append(ready)
+            for i in ready:
+                known_variables.update(self.chains[i].output_keys)
+            remaining = [i for i in remaining if i not in ready]
+        self._levels = levels
+
     @property
     def input_keys(self) -> List[str]:
         """Expect input key.
@@ -43,55 +91,177 @@ class SequentialChain(Chain, BaseModel):
         """Validate that the correct inputs exist for all chains."""
         chains = values["chains"]
         input_variables = values["input_variables"]
-        known_variables = set(input_variables)
+        # A dict doubles as an ordered known-set; membership tests are O(1)
+        # and no intermediate sets are allocated per chain.
+        known_variables = dict.fromkeys(input_variables)
         for chain in chains:
-            missing_vars = set(chain.input_keys).difference(known_variables)
+            in_keys = chain.input_keys
+            out_keys = chain.output_keys
+            missing_vars = {k for k in in_keys if k not in known_variables}
             if missing_vars:
                 raise ValueError(f"Missing required input keys: {missing_vars}")
-            overlapping_keys = known_variables.intersection(chain.output_keys)
+            overlapping_keys = {k for k in out_keys if k in known_variables}
             if overlapping_keys:
                 raise ValueError(
                     f"Chain returned keys that already exist: {overlapping_keys}"
                 )
-            known_variables |= set(chain.output_keys)
+            known_variables.update(dict.fromkeys(out_keys))
 
         if "output_variables" not in values:
             if values.get("return_all", False):
-                output_keys = known_variables.difference(input_variables)
+                initial = set(input_variables)
+                output_keys = [k for k in known_variables if k not in initial]
             else:
                 output_keys = chains[-1].output_keys
             values["output_variables"] = output_keys
         else:
-            missing_vars = set(values["output_variables"]).difference(known_variables)
+            missing_vars = {
+                k for k in values["output_variables"] if k not in known_variables
+            }
             if missing_vars:
                 raise ValueError(
                     f"Expected output variables that were not found: {missing_vars}."
                 )
         return values
 
+    def _cache_key(
+        self, i: int, known_values: Mapping[str, str]
+    ) -> Tuple[int, FrozenSet[Tuple[str, str]]]:
+        """Build the exact-match cache key for sub-chain ``i``."""
+        return (
+            id(self.chains[i]),
+            frozenset((k, known_values[k]) for k in self._chain_input_keys[i]),
+        )
+
+    def _run_chain(self, i: int, known_values: Mapping[str, str]) -> Dict[str, str]:
+        """Run sub-chain ``i``, consulting the exact-match cache if enabled."""
+        chain = self.chains[i]
+        chain_inputs = {k: known_values[k] for k in self._chain_input_keys[i]}
+        if self.cache is None:
+            return chain(chain_inputs, return_only_outputs=True)
+        key = self._cache_key(i, known_values)
+        outputs = self.cache.get(key)
+        if outputs is None:
+            outputs = chain(chain_inputs, return_only_outputs=True)
+            self.cache[key] = outputs
+        return outputs
+
+    async def _arun_chain(
+        self, i: int, known_values: Mapping[str, str]
+    ) -> Dict[str, str]:
+        """Async version of ``_run_chain``."""
+        chain = self.chains[i]
+        chain_inputs = {k: known_values[k] for k in self._chain_input_keys[i]}
+        if self.cache is None:
+            return await chain.acall(chain_inputs, return_only_outputs=True)
+        key = self._cache_key(i, known_values)
+        outputs = self.cache.get(key)
+        if outputs is None:
+            outputs = await chain.acall(chain_inputs, return_only_outputs=True)
+            self.cache[key] = outputs
+        return outputs
+
+    def _run_level(
+        self, level: List[int], known_values: Mapping[str, str]
+    ) -> Dict[int, Dict[str, str]]:
+        """Run one dependency level, batching LLMChains that share an LLM.
+
+        Independent LLMChains backed by the same LLM are merged into a single
+        ``llm.generate`` call, amortizing one HTTP round trip over the whole
+        fan-out. Everything else runs through ``_run_chain``. LLMs are grouped
+        by their identifying params (pydantic copies model instances on
+        validation, so object identity cannot be used here).
+
+        Batching bypasses the sub-chain's ``__call__``, so chains with memory
+        or verbose callbacks must not be batched or their memory updates and
+        chain-level callbacks would be skipped.
+        """
+        results: Dict[int, Dict[str, str]] = {}
+        groups: Dict[str, List[int]] = {}
+        for i in level:
+            chain = self.chains[i]
+            if (
+                isinstance(chain, LLMChain)
+                and self.cache is None
+                and chain.memory is None
+                and not chain.verbose
+            ):
+                llm_string = str(sorted(chain.llm._llm_dict().items()))
+                groups.setdefault(llm_string, []).append(i)
+            else:
+                results[i] = self._run_chain(i, known_values)
+        for indices in groups.values():
+            if len(indices) == 1:
+                results[indices[0]] = self._run_chain(indices[0], known_values)
+                continue
+            prompts = []
+            for i in indices:
+                chain = self.chains[i]
+                chain_inputs = {k: known_values[k] for k in self._chain_input_keys[i]}
+                prompts.append(chain.prompt.format(**chain_inputs))
+            response = self.chains[indices[0]].llm.generate(prompts)
+            for i, generation in zip(indices, response.generations):
+                results[i] = {self.chains[i].output_key: generation[0].text}
+        return results
+
     def _call(self, inputs: Dict[str, str]) -> Dict[str, str]:
-        known_values = inputs.copy()
-        for i, chain in enumerate(self.chains):
-            outputs = chain(known_values, return_only_outputs=True)
-            if self.verbose:
-                print(f"\033[1mChain {i}\033[0m:\n{outputs}\n")
-            known_values.update(outputs)
-        return {k: known_values[k] for k in self.output_variables}
+        # Bind pydantic-backed attributes to locals once; each access goes
+        # through a descriptor otherwise.
+        verbose = self.verbose
+        callback_manager = self.callback_manager
+        # Layer each sub-chain's outputs over the inputs instead of copying
+        # the accumulated dict; lookups stay O(1) for shallow pipelines.
+        known_values: ChainMap = ChainMap({}, inputs)
+        for level in self._levels:
+            if len(level) == 1:
+                # Specialized path for the common serial shape: no grouping
+                # or scatter bookkeeping, just the one sub-chain.
+                i = level[0]
+                outputs = self._run_chain(i, known_values)
+                if verbose:
+                    callback_manager.on_text(_chain_step_summary(i, outputs), end="\n")
+                known_values = known_values.new_child(outputs)
+                continue
+            results = self._run_level(level, known_values)
+            for i in level:
+                outputs = results[i]
+                if verbose:
+                    callback_manager.on_text(_chain_step_summary(i, outputs), end="\n")
+                known_values = known_values.new_child(outputs)
+        return {k: known_values[k] for k in self._output_key_tuple}
+
+    async def _acall(self, inputs: Dict[str, str]) -> Dict[str, str]:
+        verbose = self.verbose
+        callback_manager = self.callback_manager
+        known_values: ChainMap = ChainMap({}, inputs)
+        for level in self._levels:
+            results = await asyncio.gather(
+                *[self._arun_chain(i, known_values) for i in level]
+            )
+            for i, outputs in zip(level, results):
+                if verbose:
+                    callback_manager.on_text(_chain_step_summary(i, outputs), end="\n")
+                known_values = known_values.new_child(outputs)
+        return {k: known_values[k] for k in self._output_key_tuple}
 
 
-class SimpleSequentialChain(Chain, BaseModel):
+class SimpleSequentialChain(_BaseSequential):
     """Simple chain where the outputs of one step feed directly into next."""
 
-    chains: List[Chain]
     strip_outputs: bool = False
     input_key: str = "input"  #: :meta private:
     output_key: str = "output"  #: :meta private:
+    cache: Optional[MutableMapping[Tuple[int, str], str]] = None
+    """Optional mapping used to memoize sub-chain outputs by exact input."""
+    _colors: Tuple[str, ...] = PrivateAttr(default=())
 
-    class Config:
-        """Configuration for this pydantic object."""
-
-        extra = Extra.forbid
-        arbitrary_types_allowed = True
+    def __init__(self, **data: Any) -> None:
+        """Initialize the chain and precompute the color of each step."""
+        super().__init__(**data)
+        # Index colors by step number directly so _call never rebuilds the
+        # mapping or allocates str(i) keys.
+        color_mapping = get_color_mapping([str(i) for i in range(len(self.chains))])
+        self._colors = tuple(color_mapping[str(i)] for i in range(len(self.chains)))
 
     @property
     def input_keys(self) -> List[str]:
@@ -126,41 +296,93 @@ class SimpleSequentialChain(Chain, BaseModel):
         return values
 
     def _call(self, inputs: Dict[str, str]) -> Dict[str, str]:
+        cache = self.cache
+        strip_outputs = self.strip_outputs
+        verbose = self.verbose
+        callback_manager = self.callback_manager
         _input = inputs[self.input_key]
-        color_mapping = get_color_mapping([str(i) for i in range(len(self.chains))])
         for i, chain in enumerate(self.chains):
-            _input = chain.run(_input)
-            if self.strip_outputs:
+            if cache is not None:
+                key = (id(chain), _input)
+                output = cache.get(key)
+                if output is None:
+                    output = chain.run(_input)
+                    cache[key] = output
+                _input = output
+            else:
+                _input = chain.run(_input)
+            if strip_outputs:
                 _input = _input.strip()
-            if self.verbose:
-                self.callback_manager.on_text(
-                    _input, color=color_mapping[str(i)], end="\n"
-                )
+            if verbose:
+                callback_manager.on_text(_input, color=self._colors[i], end="\n")
         return {self.output_key: _input}
 
 
-class SequentailChainWithPreviousContext(SequentialChain, BaseModel):
+class SequentailChainWithPreviousContext(SequentialChain):
     """
     Chain which keep the previous contexts.
     A -> AB -> ABC -> ABCD
     """
 
-    chains: List[Chain]
-    return_all: bool = False
-    context: str = ""
+    context_parts: List[str] = Field(default_factory=list)
+    _original_templates: List[str] = PrivateAttr(default_factory=list)
+    _prompt_input_vars: List[Tuple[str, ...]] = PrivateAttr(default_factory=list)
+
+    @root_validator(pre=True)
+    def validate_no_cache(cls, values: Dict) -> Dict:
+        """Reject the inherited exact-match cache, which is unsound here."""
+        if values.get("cache") is not None:
+            raise ValueError(
+                "cache is not supported by SequentailChainWithPreviousContext: "
+                "sub-chain outputs depend on the accumulated context, so "
+                "exact-match lookups on the inputs alone would return stale "
+                "results."
+            )
+        return values
+
+    def __init__(self, **data: Any) -> None:
+        """Initialize the chain and capture each sub-chain's original template."""
+        super().__init__(**data)
+        self._original_templates = [chain.prompt.template for chain in self.chains]
+        self._prompt_input_vars = [
+            tuple(chain.prompt.input_variables) for chain in self.chains
+        ]
+
+    @property
+    def context(self) -> str:
+        """Full accumulated context, joined from its segments."""
+        return "".join(self.context_parts)
+
+    async def _acall(self, inputs: Dict[str, str]) -> Dict[str, str]:
+        """Run the context-aware serial logic in an executor.
+
+        Each step must see the context accumulated by the previous ones, so
+        the level-parallel SequentialChain._acall does not apply here; fall
+        back to running the synchronous _call off the event loop.
+        """
+        return await Chain._acall(self, inputs)
 
     def _call(self, inputs: Dict[str, str]) -> Dict[str, str]:
-        known_values = inputs.copy()
+        known_values: ChainMap = ChainMap({}, inputs)
         for i, chain in enumerate(self.chains):
-            chain.prompt.template = self.context + chain.prompt.template
+            # Prepend the accumulated context on a copy scoped to this call,
+            # so the shared chain.prompt is never mutated and the template
+            # does not grow across invocations.
+            prompt = chain.prompt.copy(
+                update={"template": self.context + self._original_templates[i]}
+            )
             # Only keep the variables input_variables for known_values
-            used_values = {k: known_values[k] for k in chain.prompt.input_variables}
-            outputs = chain(used_values, return_only_outputs=True)
-            prompt = chain.prompt.format(**used_values)
+            used_values = {k: known_values[k] for k in self._prompt_input_vars[i]}
+            outputs = chain.copy(update={"prompt": prompt})(
+                used_values, return_only_outputs=True
+            )
             response = outputs[chain.output_key]
-            self.context = prompt + response
+            # Append only the new segments; joining on demand keeps total
+            # copying linear in the conversation length.
+            self.context_parts.append(chain.prompt.format(**used_values))
+            self.context_parts.append(response)
 
             if self.verbose:
-                print(f"\033[1mChain {i}\033[0m:\n{outputs}\n")
-            known_values.update(outputs)
-        return {k: known_values[k] for k in self.output_variables}
+                self.callback_manager.on_text(_chain_step_summary(i, outputs), end="\n")
+            known_values = known_values.new_child(outputs)
+        return {k: known_values[k] for k in self._output_key_tuple}
@@ -1,8 +1,8 @@
 """Unit tests for agents."""
 
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterator, List, Mapping, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import PrivateAttr
 
 from langchain.agents import AgentExecutor, Tool, initialize_agent
 from langchain.callbacks.base import CallbackManager
@@ -10,18 +10,25 @@ from langchain.llms.base import LLM
 from tests.unit_tests.callbacks.fake_callback_handler import FakeCallbackHandler
 
 
-class FakeListLLM(LLM, BaseModel):
-    """Fake LLM for testing that outputs elements of a list."""
+class FakeListLLM(LLM):
+    """Fake LLM for testing that outputs elements of a list.
 
-    responses: List[str]
-    i: int = -1
+    Responses are consumed with next() on a built-in iterator, which is
+    atomic under the GIL, so one instance can safely be shared across
+    threads or an async fan-out without a lock.
+    """
+
+    responses: Tuple[str, ...]
+    _it: Iterator[str] = PrivateAttr()
+
+    def __init__(self, **data: Any) -> None:
+        """Initialize the LLM and start iterating over the responses."""
+        super().__init__(**data)
+        self._it = iter(self.responses)
 
     def _call(self, prompt: str, stop: Optional[List[str]] = None) -> str:
-        """Increment counter, and then return response in that index."""
-        self.i += 1
-        print(self.i)
-        print(self.responses)
-        return self.responses[self.i]
+        """Return the next response in the list."""
+        return next(self._it)
 
     @property
     def _identifying_params(self) -> Mapping[str, Any]:
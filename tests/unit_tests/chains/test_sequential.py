@@ -1,11 +1,19 @@
 """Test pipeline functionality."""
-from typing import Dict, List
+import asyncio
+from typing import Any, Dict, List, Optional
 
 import pytest
 from pydantic import BaseModel
 
 from langchain.chains.base import Chain
-from langchain.chains.sequential import SequentialChain, SimpleSequentialChain
+from langchain.chains.llm import LLMChain
+from langchain.chains.sequential import (
+    SequentailChainWithPreviousContext,
+    SequentialChain,
+    SimpleSequentialChain,
+)
+from langchain.prompts.prompt import PromptTemplate
+from tests.unit_tests.llms.fake_llm import FakeLLM
 
 
 class FakeChain(Chain, BaseModel):
@@ -13,6 +21,7 @@ class FakeChain(Chain, BaseModel):
 
     input_variables: List[str]
     output_variables: List[str]
+    num_calls: int = 0
 
     @property
     def input_keys(self) -> List[str]:
@@ -25,6 +34,7 @@ class FakeChain(Chain, BaseModel):
         return self.output_variables
 
     def _call(self, inputs: Dict[str, str]) -> Dict[str, str]:
+        self.num_calls += 1
         outputs = {}
         for var in self.output_variables:
             variables = [inputs[k] for k in self.input_variables]
@@ -69,6 +79,19 @@ def test_sequential_usage_multiple_outputs() -> None:
     assert output == expected_output
 
 
+def test_sequential_async_usage() -> None:
+    """Test sequential chains with independent steps run concurrently."""
+    chain_1 = FakeChain(input_variables=["foo"], output_variables=["bar"])
+    chain_2 = FakeChain(input_variables=["foo"], output_variables=["baz"])
+    chain_3 = FakeChain(input_variables=["bar", "baz"], output_variables=["qux"])
+    chain = SequentialChain(chains=[chain_1, chain_2, chain_3], input_variables=["foo"])
+    # Chains 1 and 2 only depend on the original input, so they share a level.
+    assert chain._levels == [[0, 1], [2]]
+    output = asyncio.run(chain.acall({"foo": "123"}))
+    expected_output = {"qux": "123foo 123foofoo", "foo": "123"}
+    assert output == expected_output
+
+
 def test_sequential_missing_inputs() -> None:
     """Test error is raised when input variables are missing."""
     chain_1 = FakeChain(input_variables=["foo"], output_variables=["bar"])
@@ -124,6 +147,133 @@ def test_simple_sequential_functionality() -> None:
     assert output == expected_output
 
 
+class CountingFakeLLM(FakeLLM):
+    """Fake LLM that records how many generate batches it served."""
+
+    num_batches: int = 0
+
+    def generate(self, prompts: List[str], stop: Optional[List[str]] = None) -> Any:
+        """Count the batch, then defer to the regular fake generation."""
+        self.num_batches += 1
+        return super().generate(prompts, stop=stop)
+
+
+def test_sequential_batches_same_llm_fan_out() -> None:
+    """Test independent LLMChains sharing an LLM are batched into one call."""
+    llm = CountingFakeLLM(queries={"Say 123": "rab", "Yell 123": "zab"})
+    chain_a = LLMChain(
+        llm=llm,
+        prompt=PromptTemplate(input_variables=["foo"], template="Say {foo}"),
+        output_key="bar",
+    )
+    chain_b = LLMChain(
+        llm=llm,
+        prompt=PromptTemplate(input_variables=["foo"], template="Yell {foo}"),
+        output_key="baz",
+    )
+    chain = SequentialChain(
+        chains=[chain_a, chain_b],
+        input_variables=["foo"],
+        output_variables=["bar", "baz"],
+    )
+    output = chain({"foo": "123"}, return_only_outputs=True)
+    assert output == {"bar": "rab", "baz": "zab"}
+    assert llm.num_batches == 1
+
+
+def test_sequential_cache_skips_repeated_calls() -> None:
+    """Test identical inputs hit the cache instead of re-running sub-chains."""
+    chain_1 = FakeChain(input_variables=["foo"], output_variables=["bar"])
+    chain_2 = FakeChain(input_variables=["bar"], output_variables=["baz"])
+    chain = SequentialChain(
+        chains=[chain_1, chain_2], input_variables=["foo"], cache={}
+    )
+    first = chain({"foo": "123"})
+    second = chain({"foo": "123"})
+    assert first == second
+    assert chain_1.num_calls == 1
+    assert chain_2.num_calls == 1
+    # A new input misses the cache and runs the sub-chains again.
+    chain({"foo": "456"})
+    assert chain_1.num_calls == 2
+
+
+def test_simple_sequential_cache_skips_repeated_calls() -> None:
+    """Test the simple sequential cache memoizes on the exact input string."""
+    chain_1 = FakeChain(input_variables=["foo"], output_variables=["bar"])
+    chain_2 = FakeChain(input_variables=["bar"], output_variables=["baz"])
+    chain = SimpleSequentialChain(chains=[chain_1, chain_2], cache={})
+    first = chain({"input": "123"})
+    second = chain({"input": "123"})
+    assert first == second
+    assert chain_1.num_calls == 1
+    assert chain_2.num_calls == 1
+
+
+def test_sequential_with_context_leaves_templates_untouched() -> None:
+    """Test the context is prepended without mutating the shared prompts."""
+    queries = {
+        "Say 123": "rab",
+        "Say 123rabThen rab": "done",
+    }
+    chain_1 = LLMChain(
+        llm=FakeLLM(queries=queries),
+        prompt=PromptTemplate(input_variables=["foo"], template="Say {foo}"),
+        output_key="bar",
+    )
+    chain_2 = LLMChain(
+        llm=FakeLLM(queries=queries),
+        prompt=PromptTemplate(input_variables=["bar"], template="Then {bar}"),
+        output_key="baz",
+    )
+    chain = SequentailChainWithPreviousContext(
+        chains=[chain_1, chain_2], input_variables=["foo"]
+    )
+    output = chain({"foo": "123"}, return_only_outputs=True)
+    assert output == {"baz": "done"}
+    assert chain.context == "Say 123rabThen rabdone"
+    # The sub-chain prompts must not accumulate the context across calls.
+    assert chain_1.prompt.template == "Say {foo}"
+    assert chain_2.prompt.template == "Then {bar}"
+
+
+def test_sequential_with_context_rejects_cache() -> None:
+    """Test the context chain refuses the exact-match cache."""
+    chain_1 = LLMChain(
+        llm=FakeLLM(),
+        prompt=PromptTemplate(input_variables=["foo"], template="Say {foo}"),
+        output_key="bar",
+    )
+    with pytest.raises(ValueError):
+        SequentailChainWithPreviousContext(
+            chains=[chain_1], input_variables=["foo"], cache={}
+        )
+
+
+def test_sequential_with_context_async_matches_sync() -> None:
+    """Test acall on the context chain runs the serial context-aware logic."""
+    queries = {
+        "Say 123": "rab",
+        "Say 123rabThen rab": "done",
+    }
+    chain_1 = LLMChain(
+        llm=FakeLLM(queries=queries),
+        prompt=PromptTemplate(input_variables=["foo"], template="Say {foo}"),
+        output_key="bar",
+    )
+    chain_2 = LLMChain(
+        llm=FakeLLM(queries=queries),
+        prompt=PromptTemplate(input_variables=["bar"], template="Then {bar}"),
+        output_key="baz",
+    )
+    chain = SequentailChainWithPreviousContext(
+        chains=[chain_1, chain_2], input_variables=["foo"]
+    )
+    output = asyncio.run(chain.acall({"foo": "123"}, return_only_outputs=True))
+    assert output == {"baz": "done"}
+    assert chain.context == "Say 123rabThen rabdone"
+
+
 def test_multi_input_errors() -> None:
     """Test simple sequential errors if multiple input variables are expected."""
     chain_1 = FakeChain(input_variables=["foo"], output_variables=["bar"])